@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import os
 import time
 
 from pathlib import Path
@@ -8,19 +7,31 @@ from copy import deepcopy
 from typing import TYPE_CHECKING
 
 import numpy as np
-import matplotlib.pyplot as plt
 
-from ruamel.yaml import YAML
+from scipy import sparse
+
+from .._core import Constants, IDASolver
+from .._core._idasolver import bandwidth
+from .._utils import (
+    ExitHandler, ProgressBar, short_warn, _param_key, _load_yaml,
+)
+from ..plotutils import format_ticks
+
+from .dae import residuals
+from .domains import Battery, Electrolyte, Electrode, Separator
+from ._solutions import StepSolution, CycleSolution
 
 if TYPE_CHECKING:  # pragma: no cover
     from bmlite import Experiment
-    from ._solutions import StepSolution, CycleSolution
+
+_TEMPLATES = Path(__file__).parent / 'templates'
 
 
 class Simulation:
 
     __slots__ = ['_yamlfile', '_yamlpath', '_t0', '_sv0', '_svdot0', '_lband',
-                 '_uband', '_algidx', 'c', 'bat', 'el', 'an', 'sep', 'ca']
+                 '_uband', '_algidx', '_jpat', '_prekey', '_xmesh', '_xptr',
+                 'c', 'bat', 'el', 'an', 'sep', 'ca']
 
     def __init__(self, yamlfile: str = 'graphite_nmc532') -> None:
         """
@@ -57,20 +68,17 @@ class Simulation:
             default template.
 
         """
-        from .. import Constants
-        from .._utils import short_warn
-        from .domains import Battery, Electrolyte, Electrode, Separator
-
         if '.yaml' not in yamlfile:
             yamlfile += '.yaml'
 
-        defaults = os.listdir(os.path.dirname(__file__) + '/templates')
-        if yamlfile in defaults:
-            path = os.path.dirname(__file__) + '/templates/' + yamlfile
+        # Only bare file names can refer to a packaged template, anything
+        # with a directory part (even './') is a user path
+        default = _TEMPLATES / yamlfile
+        if Path(yamlfile).name == yamlfile and default.is_file():
             short_warn(f"P2D Simulation: Using default {yamlfile}")
-            yamlpath = Path(path)
+            yamlpath = default
 
-        elif os.path.exists(yamlfile):
+        elif Path(yamlfile).is_file():
             yamlpath = Path(yamlfile)
 
         else:
@@ -79,8 +87,7 @@ class Simulation:
         self._yamlfile = yamlfile
         self._yamlpath = yamlpath
 
-        yaml = YAML(typ='safe')
-        yamldict = yaml.load(yamlpath)
+        yamldict = _load_yaml(yamlpath)
 
         self.c = Constants()
         self.bat = Battery(**yamldict['battery'])
@@ -90,6 +97,7 @@ class Simulation:
         self.ca = Electrode('cathode', **yamldict['cathode'])
 
         # Pre process dependent parameters, mesh, etc.
+        self._prekey = None
         self.pre()
 
     def pre(self) -> None:
@@ -110,6 +118,48 @@ class Simulation:
         if they do so. Otherwise, the dependent parameters may not be
         consistent with the user-defined inputs.
 
+        """
+        domains = (self.bat, self.el, self.an, self.sep, self.ca)
+
+        # Skip the mesh, pointers, etc. if no parameters changed since the
+        # last pre(), e.g., when resetting the state at the end of run()
+        if _param_key(*domains) != self._prekey:
+            self._update_domains()
+
+        # Initialize potentials [V]
+        Eeq_an = self.an.get_Eeq(self.an.x_0)
+
+        self.an.phi_0 = 0.
+        self.el.phi_0 = -Eeq_an
+        self.ca.phi_0 = self.ca.get_Eeq(self.ca.x_0) - Eeq_an
+
+        # Initialize sv and svdot
+        self._t0 = 0.
+        self._sv0 = self._rested_state()
+        self._svdot0 = np.zeros_like(self._sv0)
+
+        self._prekey = _param_key(*domains)
+
+    def _rested_state(self) -> np.ndarray:
+        """
+        Build the rested state vector at 'soc0' from the domain `sv0()`
+        methods, each writing into its own slice of a single buffer.
+
+        """
+        sv0 = np.empty(self.ca.ptr['start'] + self.ca.ptr['size'])
+
+        for domain in [self.an, self.sep, self.ca]:
+            start = domain.ptr['start']
+            size = domain.ptr['size']
+            domain.sv0(self.el, out=sv0[start:start + size])
+
+        return sv0
+
+    def _update_domains(self) -> None:
+        """
+        Update dependent parameters, meshes, pointers, algebraic indices, and
+        bandwidths. Called by `pre()` when any parameters have changed.
+
         """
         # Update dependent parameters
         self.bat.update()
@@ -124,30 +174,50 @@ class Simulation:
         self.ca.make_mesh(xshift=self.an.thick + self.sep.thick,
                           pshift=self.an.ptr['shift'] + self.sep.ptr['shift'])
 
-        # Initialize potentials [V]
-        self.an.phi_0 = 0.
-
-        self.el.phi_0 = -self.an.get_Eeq(self.an.x_0)
-
-        self.ca.phi_0 = self.ca.get_Eeq(self.ca.x_0) \
-                      - self.an.get_Eeq(self.an.x_0)
-
-        # Initialize sv and svdot
-        self._t0 = 0.
-        self._sv0 = np.hstack([self.an.sv0(self.el), self.sep.sv0(self.el),
-                               self.ca.sv0(self.el)])
+        # Full-cell electrolyte pointers, gathers each variable in one index
+        self._xptr = {
+            key: np.concat([self.an.x_ptr[key], self.sep.x_ptr[key],
+                            self.ca.x_ptr[key]])
+            for key in ['ce', 'phie']
+        }
 
-        self._svdot0 = np.zeros_like(self._sv0)
+        # Full-cell x mesh, interface weights, and weights with the Bruggeman
+        # factors folded in, used by the residuals
+        x = np.concat([self.an.x, self.sep.x, self.ca.x])
+        xm = np.concat([self.an.xm, self.sep.xm, self.ca.xm])
+        xp = np.concat([self.an.xp, self.sep.xp, self.ca.xp])
+
+        dx = x[1:] - x[:-1]
+
+        wt_m = 0.5*(xp[:-1] - xm[:-1]) / dx
+        wt_p = 0.5*(xp[1:] - xm[1:]) / dx
+
+        eps_tau = np.concat([
+            self.an.brugg_liq * np.ones(self.an.Nx),
+            self.sep.brugg_liq * np.ones(self.sep.Nx),
+            self.ca.brugg_liq * np.ones(self.ca.Nx),
+        ])
+
+        self._xmesh = {
+            'dx': dx,
+            'wt_m': wt_m,
+            'wt_p': wt_p,
+            'wt_m_eff': wt_m*eps_tau[:-1],
+            'wt_p_eff': wt_p*eps_tau[1:],
+        }
 
         # Algebraic indices
-        self._algidx = self.an.algidx().tolist() + self.sep.algidx().tolist() \
-                     + self.ca.algidx().tolist()
+        self._algidx = np.concat([self.an.algidx(), self.sep.algidx(),
+                                  self.ca.algidx()])
 
         # Determine the bandwidth
         # self._lband, self._uband, _ = bandwidth(self)
         self._lband = max(self.an.ptr['x_off'], self.ca.ptr['x_off']) + 1
         self._uband = max(self.an.ptr['x_off'], self.ca.ptr['x_off']) + 1
 
+        # Sparsity pattern, built lazily by _sparsity()
+        self._jpat = None
+
     def j_pattern(
         self,
         plot: bool = True,
@@ -156,6 +226,12 @@ class Simulation:
         """
         Determine the Jacobian pattern.
 
+        Each column of the rested state is perturbed one at a time (see
+        `bandwidth`), so the probe does not assume a band and also shows any
+        couplings outside the band used for the cached 'sparse' solver
+        pattern. This is a diagnostic and is not used when running
+        experiments.
+
         Parameters
         ----------
         plot : bool, optional
@@ -172,15 +248,10 @@ class Simulation:
             The upper half bandwidth. Only returned if `return_bands=True`.
 
         """
-        from .dae import residuals
-        from .._utils import ExitHandler
-        from .._core._idasolver import bandwidth
-        from bmlite.plotutils import format_ticks
+        import matplotlib.pyplot as plt
 
         t0 = 0.
-        y0 = np.hstack([self.an.sv0(self.el), self.sep.sv0(self.el),
-                        self.ca.sv0(self.el)])
-
+        y0 = self._rested_state()
         yp0 = np.zeros_like(y0)
 
         step = {
@@ -250,25 +321,31 @@ class Simulation:
         makes it easier to fine tune solver options, and allows for analyses
         or control decisions in the middle of an experiment.
 
-        """
-        from bmlite import IDASolver
-
-        from .dae import residuals
-        from ._solutions import StepSolution
+        The P2D model defaults to the 'sparse' linear solver with a cached
+        Jacobian sparsity pattern. Solver options given to the `Experiment`,
+        e.g., `linsolver='band'` with custom `lband` and `uband`, take
+        precedence over these defaults.
 
+        """
         step = expr.steps[stepidx].copy()
-        options = expr._step_options[stepidx].copy()
 
         if not callable(step['value']):
             value = step['value']
             step['value'] = lambda t: value
 
-        options['userdata'] = (self, step)
-        options['calc_initcond'] = 'yp0'
-        options['algebraic_idx'] = self._algidx
-        options['linsolver'] = 'band'
-        options['lband'] = self._lband
-        options['uband'] = self._uband
+        options = {
+            'linsolver': 'sparse',
+            **expr._step_options[stepidx],
+            'userdata': (self, step),
+            'calc_initcond': 'yp0',
+            'algebraic_idx': self._algidx,
+        }
+
+        if options['linsolver'] == 'sparse':
+            options.setdefault('sparsity', self._sparsity())
+        elif 'band' in options['linsolver']:
+            options.setdefault('lband', self._lband)
+            options.setdefault('uband', self._uband)
 
         if step['limits'] is not None:
             _setup_eventsfn(step['limits'], options)
@@ -333,9 +410,6 @@ class Simulation:
         CycleSolution : Wrapper for an all-steps solution.
 
         """
-        from bmlite._utils import ProgressBar
-        from ._solutions import CycleSolution
-
         iterator = range(expr.num_steps)
         if bar:
             iterator = ProgressBar(iterator)
@@ -355,6 +429,78 @@ class Simulation:
 
         return soln
 
+    def _sparsity(self) -> sparse.csc_matrix:
+        """
+        Jacobian sparsity pattern for the 'sparse' linear solver.
+
+        The pattern is approximated by finite differences of `residuals`.
+        Rather than perturbing one column at a time, columns separated by
+        more than the full bandwidth cannot share a row, so they are
+        perturbed together. This only requires `lband + uband + 1` calls
+        to `residuals`. The pattern is cached until the next `pre()` call.
+
+        Returns
+        -------
+        j_pat : sparse.csc_matrix
+            Jacobian pattern with ones at all structurally nonzero entries.
+
+        """
+        if self._jpat is not None:
+            return self._jpat
+
+        step = {
+            'mode': 'current',
+            'units': 'C',
+            'value': lambda t: 0.,
+        }
+
+        userdata = (self, step)
+
+        t0 = 0.
+        y0 = self._rested_state()
+        yp0 = np.zeros_like(y0)
+
+        y, yp = y0.copy(), yp0.copy()
+
+        res_0 = np.zeros_like(y)
+        res = np.zeros_like(y)
+
+        residuals(t0, y, yp, res_0, userdata)
+
+        N = y.size
+        lband, uband = self._lband, self._uband
+        stride = lband + uband + 1
+
+        i_all, j_all = [np.arange(N)], [np.arange(N)]
+        for k in range(stride):
+            cols = np.arange(k, N, stride)
+
+            y[cols] += np.maximum(1e-6, 1e-6*np.abs(y[cols]))
+            yp[cols] += np.maximum(1e-6, 1e-6*np.abs(yp[cols]))
+            residuals(t0, y, yp, res, userdata)
+
+            y[cols] = y0[cols]
+            yp[cols] = yp0[cols]
+
+            # Each changed row maps back to the single perturbed column
+            # that falls within its band
+            i = np.flatnonzero(res != res_0)
+            j = i - lband + (k - i + lband) % stride
+
+            i_all.append(i)
+            j_all.append(j)
+
+        i_all, j_all = np.hstack(i_all), np.hstack(j_all)
+        j_pat = sparse.csc_matrix((np.ones(i_all.size), (i_all, j_all)),
+                                  shape=(N, N))
+
+        j_pat.sum_duplicates()
+        j_pat.data[:] = 1.
+
+        self._jpat = j_pat
+
+        return self._jpat
+
     def copy(self) -> object:
         """
         Create a copy of the Simulation instance.
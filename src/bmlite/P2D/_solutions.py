@@ -6,7 +6,6 @@ from copy import deepcopy
 from typing import Iterable, TYPE_CHECKING
 
 import numpy as np
-import matplotlib.pyplot as plt
 
 from bmlite import IDAResult
 
@@ -88,10 +87,12 @@ class BaseSolution(IDAResult):
         self.vars['sep'] = sep
         self.vars['ca'] = ca
 
+        # electrolyte values are interleaved with other variables in y, so
+        # gather each full-cell profile with one index instead of concat
         self.vars['el'] = {
             'x': np.concat([an['x'], sep['x'], ca['x']]),
-            'phie': np.concat([an['phie'], sep['phie'], ca['phie']], axis=1),
-            'ce': np.concat([an['ce'], sep['ce'], ca['ce']], axis=1),
+            'phie': self.y[:, sim._xptr['phie']],
+            'ce': self.y[:, sim._xptr['ce']],
         }
 
         # post-processed variables
@@ -124,6 +125,7 @@ class BaseSolution(IDAResult):
             please refer to documentation for `maplotlib.pyplot.plot()`.
 
         """
+        import matplotlib.pyplot as plt
         from .._utils import ExitHandler
 
         plt.figure()
@@ -399,6 +401,8 @@ class BaseSolution(IDAResult):
         }
 
         if plot:
+            import matplotlib.pyplot as plt
+
             _, ax = plt.subplots(nrows=2, ncols=3, figsize=[12, 6],
                                  layout='constrained')
 
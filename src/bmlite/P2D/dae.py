@@ -8,6 +8,8 @@ so the `'band'` linear solver option can be used in the `IDASolver` class.
 
 import numpy as np
 
+from ..mathutils import grad_x, grad_r, div_r
+
 if not hasattr(np, 'concat'):  # pragma: no cover
     np.concat = np.concatenate
 
@@ -57,8 +59,6 @@ def residuals(t: float, sv: np.ndarray, svdot: np.ndarray, res: np.ndarray,
         ========== ======================================================
 
     """
-    from ..mathutils import grad_x, grad_r, div_r
-
     # Break inputs into separate objects
     sim, exp = inputs
 
@@ -68,12 +68,14 @@ def residuals(t: float, sv: np.ndarray, svdot: np.ndarray, res: np.ndarray,
     T = bat.temp
 
     # Organize values from sv
+    Li_el = sv[sim._xptr['ce']]
+    phi_el = sv[sim._xptr['phie']]
+
     phi_an = sv[an.x_ptr['phis']]
-    Li_el_an = sv[an.x_ptr['ce']]
-    phi_el_an = sv[an.x_ptr['phie']]
+    Li_el_an = Li_el[:an.Nx]
+    phi_el_an = phi_el[:an.Nx]
 
-    xs_an = sv[an.xr_ptr['xs'].flatten()]
-    xs_an = xs_an.reshape([an.Nx, an.Nr])
+    xs_an = sv[an.xr_ptr['xs']]
     Li_an = xs_an*an.Li_max
 
     if 'Hysteresis' in an._submodels:
@@ -82,15 +84,11 @@ def residuals(t: float, sv: np.ndarray, svdot: np.ndarray, res: np.ndarray,
     else:
         Hyst_an = 0.
 
-    Li_el_sep = sv[sep.x_ptr['ce']]
-    phi_el_sep = sv[sep.x_ptr['phie']]
-
     phi_ca = sv[ca.x_ptr['phis']]
-    Li_el_ca = sv[ca.x_ptr['ce']]
-    phi_el_ca = sv[ca.x_ptr['phie']]
+    Li_el_ca = Li_el[an.Nx + sep.Nx:]
+    phi_el_ca = phi_el[an.Nx + sep.Nx:]
 
-    xs_ca = sv[ca.xr_ptr['xs'].flatten()]
-    xs_ca = xs_ca.reshape([ca.Nx, ca.Nr])
+    xs_ca = sv[ca.xr_ptr['xs']]
     Li_ca = xs_ca*ca.Li_max
 
     if 'Hysteresis' in ca._submodels:
@@ -100,45 +98,35 @@ def residuals(t: float, sv: np.ndarray, svdot: np.ndarray, res: np.ndarray,
         Hyst_ca = 0.
 
     # Pre-calculate ln(Li_el)
-    ln_Li_an = np.log(Li_el_an)
-    ln_Li_sep = np.log(Li_el_sep)
-    ln_Li_ca = np.log(Li_el_ca)
+    ln_Li = np.log(Li_el)
 
-    # Combine x meshes into single vectors
-    x = np.concat([an.x, sep.x, ca.x])
-    xm = np.concat([an.xm, sep.xm, ca.xm])
-    xp = np.concat([an.xp, sep.xp, ca.xp])
+    # Full-cell mesh spacing and weights (static, built in pre)
+    dx = sim._xmesh['dx']
+    wt_m = sim._xmesh['wt_m']
+    wt_p = sim._xmesh['wt_p']
+    wt_m_eff = sim._xmesh['wt_m_eff']
+    wt_p_eff = sim._xmesh['wt_p_eff']
 
     # Weighted electrolyte properties
-    wt_m = 0.5*(xp[:-1] - xm[:-1]) / (x[1:] - x[:-1])
-    wt_p = 0.5*(xp[1:] - xm[1:]) / (x[1:] - x[:-1])
-
-    D_el = el.get_D(np.concat([Li_el_an, Li_el_sep, Li_el_ca]), T)
-    t0 = el.get_t0(np.concat([Li_el_an, Li_el_sep, Li_el_ca]), T)
-    gam = el.get_gamma(np.concat([Li_el_an, Li_el_sep, Li_el_ca]), T)
-    kap = el.get_kappa(np.concat([Li_el_an, Li_el_sep, Li_el_ca]), T)
-
-    eps_tau = np.concat([
-        an.eps_el**an.p_liq * np.ones(an.Nx),
-        sep.eps_el**sep.p_liq * np.ones(sep.Nx),
-        ca.eps_el**ca.p_liq * np.ones(ca.Nx),
-    ])
+    D_el = el.get_D(Li_el, T)
+    t0 = el.get_t0(Li_el, T)
+    gam = el.get_gamma(Li_el, T)
+    kap = el.get_kappa(Li_el, T)
 
-    D_eff = wt_m*D_el[:-1]*eps_tau[:-1] + wt_p*D_el[1:]*eps_tau[1:]
+    D_eff = wt_m_eff*D_el[:-1] + wt_p_eff*D_el[1:]
     t0_b = np.concat([[t0[0]], wt_m*t0[:-1] + wt_p*t0[1:], [t0[-1]]])
-    k_eff = wt_m*kap[:-1]*eps_tau[:-1] + wt_p*kap[1:]*eps_tau[1:]
-    gam_b = np.concat([[gam[0]], wt_m*gam[:-1] + wt_p*gam[1:], [gam[-1]]])
-
-    # Ionoic (io) current (i) and molar (N) fluxes in electrolyte
-    phi_el = np.concat([phi_el_an, phi_el_sep, phi_el_ca])
-    Li_el = np.concat([Li_el_an, Li_el_sep, Li_el_ca])
-    ln_Li = np.concat([ln_Li_an, ln_Li_sep, ln_Li_ca])
+    k_eff = wt_m_eff*kap[:-1] + wt_p_eff*kap[1:]
+    gam_b = wt_m*gam[:-1] + wt_p*gam[1:]
 
-    ip_io = -k_eff*(phi_el[1:] - phi_el[:-1]) / (x[1:] - x[:-1]) \
-          - 2 * k_eff*c.R*T / c.F * (1 + gam_b[1:-1]) * (t0_b[1:-1] - 1) \
-              * (ln_Li[1:] - ln_Li[:-1]) / (x[1:] - x[:-1])
+    # Ionoic (io) current (i) and molar (N) fluxes in electrolyte at all x
+    # interfaces, including the no-flux boundaries at x = 0 and x = L
+    i_io = np.zeros(phi_el.size + 1)
+    i_io[1:-1] = -k_eff*(phi_el[1:] - phi_el[:-1]) / dx \
+               - 2 * k_eff*c.R*T / c.F * (1 + gam_b) * (t0_b[1:-1] - 1) \
+                   * (ln_Li[1:] - ln_Li[:-1]) / dx
 
-    Np_io = D_eff*(Li_el[1:] - Li_el[:-1]) / (x[1:] - x[:-1])
+    N_io = np.zeros(Li_el.size + 1)
+    N_io[1:-1] = D_eff*(Li_el[1:] - Li_el[:-1]) / dx
 
     # Reaction terms ----------------------------------------------------------
 
@@ -147,16 +135,14 @@ def residuals(t: float, sv: np.ndarray, svdot: np.ndarray, res: np.ndarray,
     fluxdir_an = -np.sign(eta)
 
     i0 = an.get_i0(xs_an[:, -1], Li_el_an, T, fluxdir_an)
-    sdot_an = i0 / c.F * (  np.exp( an.alpha_a*c.F*eta / c.R / T)
-                          - np.exp(-an.alpha_c*c.F*eta / c.R / T)  )
+    sdot_an = an.get_sdot(eta, i0, T)
 
     # Cathode overpotentials and Li+ productions
     eta = phi_ca - phi_el_ca - (ca.get_Eeq(xs_ca[:, -1]) + Hyst_ca)
     fluxdir_ca = -np.sign(eta)
 
     i0 = ca.get_i0(xs_ca[:, -1], Li_el_ca, T, fluxdir_ca)
-    sdot_ca = i0 / c.F * (  np.exp( ca.alpha_a*c.F*eta / c.R / T)
-                          - np.exp(-ca.alpha_c*c.F*eta / c.R / T)  )
+    sdot_ca = ca.get_sdot(eta, i0, T)
 
     # Boundary condition ------------------------------------------------------
     mode = exp['mode']
@@ -165,7 +151,7 @@ def residuals(t: float, sv: np.ndarray, svdot: np.ndarray, res: np.ndarray,
 
     # External current [A/m2]
     i_ext = -sdot_ca[-1]*ca.A_s*c.F*(ca.xp[-1] - ca.xm[-1]) \
-          - ca.sigma_s*ca.eps_s**ca.p_sol \
+          - ca.sigma_s*ca.brugg_sol \
               * (phi_ca[-1] - phi_ca[-2]) / (ca.x[-1] - ca.x[-2])
 
     if mode == 'current' and units == 'A':
@@ -183,25 +169,22 @@ def residuals(t: float, sv: np.ndarray, svdot: np.ndarray, res: np.ndarray,
     t0_an = t0_b[:an.Nx + 1]
 
     # Electrolyte fluxes with boundary conditions at x = 0
-    im_el = np.concat([[0.], ip_io[:an.Nx - 1]])
-    Nm_el = np.concat([[0.], Np_io[:an.Nx - 1]])
+    im_el = i_io[:an.Nx]
+    Nm_el = N_io[:an.Nx]
 
-    ip_el = ip_io[:an.Nx]
-    Np_el = Np_io[:an.Nx]
+    ip_el = i_io[1:an.Nx + 1]
+    Np_el = N_io[1:an.Nx + 1]
 
     # Solid-phase currents w/ BCs at x = 0 and x = an.thick
-    s_eff = an.sigma_s*an.eps_s**an.p_sol
+    s_eff = an.sigma_s*an.brugg_sol
     ip_ed = -s_eff*grad_x(an.x, phi_an)
 
     im_ed = np.concat([[i_ext], ip_ed])
     ip_ed = np.concat([ip_ed, [0.]])
 
     # Weighted solid particle properties
-    wt_m = 0.5*(an.rp[:-1] - an.rm[:-1]) / (an.r[1:] - an.r[:-1])
-    wt_p = 0.5*(an.rp[1:] - an.rm[1:]) / (an.r[1:] - an.r[:-1])
-
-    Ds = wt_m*an.get_Ds(xs_an[:, :-1], T, fluxdir_an) \
-       + wt_p*an.get_Ds(xs_an[:, 1:], T, fluxdir_an)
+    Ds = an.get_Ds(xs_an, T, fluxdir_an)
+    Ds = an._wtm*Ds[:, :-1] + an._wtp*Ds[:, 1:]
 
     # Solid-phase radial diffusion
     Nk_ed = np.column_stack([
@@ -210,8 +193,8 @@ def residuals(t: float, sv: np.ndarray, svdot: np.ndarray, res: np.ndarray,
 
     fk_ode = div_r(an.rm, an.rp, Nk_ed)
 
-    xr_ptr = an.xr_ptr['xs'].flatten()
-    res[xr_ptr] = an.Li_max*svdot[xr_ptr] - fk_ode.flatten()
+    xr_ptr = an.xr_ptr['xs']
+    res[xr_ptr] = an.Li_max*svdot[xr_ptr] - fk_ode
 
     # Solid-phase COC (algebraic)
     res[an.x_ptr['phis']] = (ip_ed - im_ed) / (an.xp - an.xm) \
@@ -247,11 +230,11 @@ def residuals(t: float, sv: np.ndarray, svdot: np.ndarray, res: np.ndarray,
     t0_sep = t0_b[an.Nx:an.Nx + sep.Nx + 1]
 
     # Electrolyte fluxes
-    im_el = ip_io[an.Nx - 1:an.Nx + sep.Nx - 1]
-    Nm_el = Np_io[an.Nx - 1:an.Nx + sep.Nx - 1]
+    im_el = i_io[an.Nx:an.Nx + sep.Nx]
+    Nm_el = N_io[an.Nx:an.Nx + sep.Nx]
 
-    ip_el = ip_io[an.Nx:an.Nx + sep.Nx]
-    Np_el = Np_io[an.Nx:an.Nx + sep.Nx]
+    ip_el = i_io[an.Nx + 1:an.Nx + sep.Nx + 1]
+    Np_el = N_io[an.Nx + 1:an.Nx + sep.Nx + 1]
 
     # Electrolyte COC (algebraic)
     res[sep.x_ptr['phie']] = (ip_el - im_el) / (sep.xp - sep.xm)
@@ -273,25 +256,22 @@ def residuals(t: float, sv: np.ndarray, svdot: np.ndarray, res: np.ndarray,
     t0_ca = t0_b[an.Nx + sep.Nx:]
 
     # Electrolyte fluxes with boundary conditions at x = ca.thick
-    im_el = ip_io[an.Nx + sep.Nx - 1:an.Nx + sep.Nx + ca.Nx - 1]
-    Nm_el = Np_io[an.Nx + sep.Nx - 1:an.Nx + sep.Nx + ca.Nx - 1]
+    im_el = i_io[an.Nx + sep.Nx:-1]
+    Nm_el = N_io[an.Nx + sep.Nx:-1]
 
-    ip_el = np.concat([ip_io[an.Nx + sep.Nx:], [0.]])
-    Np_el = np.concat([Np_io[an.Nx + sep.Nx:], [0.]])
+    ip_el = i_io[an.Nx + sep.Nx + 1:]
+    Np_el = N_io[an.Nx + sep.Nx + 1:]
 
     # Solid-phase currents w/ BCs at x = sep.thick and x = ca.thick
-    s_eff = ca.sigma_s*ca.eps_s**ca.p_sol
+    s_eff = ca.sigma_s*ca.brugg_sol
     ip_ed = -s_eff*grad_x(ca.x, phi_ca)
 
     im_ed = np.concat([[0.], ip_ed])
     ip_ed = np.concat([ip_ed, [i_ext]])
 
     # Weighted solid particle properties
-    wt_m = 0.5*(ca.rp[:-1] - ca.rm[:-1]) / (ca.r[1:] - ca.r[:-1])
-    wt_p = 0.5*(ca.rp[1:] - ca.rm[1:]) / (ca.r[1:] - ca.r[:-1])
-
-    Ds = wt_m*ca.get_Ds(xs_ca[:, :-1], T, fluxdir_ca) \
-       + wt_p*ca.get_Ds(xs_ca[:, 1:], T, fluxdir_ca)
+    Ds = ca.get_Ds(xs_ca, T, fluxdir_ca)
+    Ds = ca._wtm*Ds[:, :-1] + ca._wtp*Ds[:, 1:]
 
     # Solid-phase radial diffusion
     Nk_ed = np.column_stack([
@@ -300,8 +280,8 @@ def residuals(t: float, sv: np.ndarray, svdot: np.ndarray, res: np.ndarray,
 
     fk_ode = div_r(ca.rm, ca.rp, Nk_ed)
 
-    xr_ptr = ca.xr_ptr['xs'].flatten()
-    res[xr_ptr] = ca.Li_max*svdot[xr_ptr] - fk_ode.flatten()
+    xr_ptr = ca.xr_ptr['xs']
+    res[xr_ptr] = ca.Li_max*svdot[xr_ptr] - fk_ode
 
     # Solid-phase COC (algebraic)
     res[ca.x_ptr['phis']] = (ip_ed - im_ed) / (ca.xp - ca.xm) \
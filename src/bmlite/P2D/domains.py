@@ -7,11 +7,24 @@ different for the anode, separator, and cathode domains.
 
 """
 
+import inspect
+
 import numpy as np
 
+from . import submodels
+from .. import materials
+from .._core import Constants
+from .._utils import _deepcopy_shared
+from ..mesh import uniform_mesh, x_ptr, xr_ptr
+
+# Read-only physical constants, shared so the residuals do not rebuild them
+_CONSTANTS = Constants()
+
 
 class Battery:
 
+    __slots__ = ['cap', 'temp', 'area']
+
     def __init__(self, **kwargs) -> None:
         """
         A class for battery-level attributes.
@@ -48,6 +61,9 @@ class Battery:
 
 class Electrolyte:
 
+    __slots__ = ['Li_0', 'D_deg', 't0_deg', 'kappa_deg', 'gamma_deg',
+                 'material', '_material', 'phi_0']
+
     def __init__(self, **kwargs) -> None:
         """
         A class for the electrolyte attributes and methods.
@@ -77,14 +93,15 @@ class Electrolyte:
         self.gamma_deg = kwargs.get('gamma_deg')
         self.material = kwargs.get('material')
 
+    def __deepcopy__(self, memo: dict) -> object:
+        return _deepcopy_shared(self, memo, ['_material'])
+
     def update(self) -> None:
         """
         Updates any secondary/dependent parameters. For the `Electrolyte`
         class, this only initializes the material class.
 
         """
-        from .. import materials
-
         ElyteMaterial = getattr(materials, self.material)
         self._material = ElyteMaterial()
 
@@ -173,6 +190,14 @@ class Electrolyte:
 
 class Electrode:
 
+    __slots__ = ['_name', 'Nx', 'Nr', 'thick', 'R_s', 'eps_s', 'eps_el',
+                 'eps_CBD', 'p_sol', 'p_liq', 'alpha_a', 'alpha_c', 'Li_max',
+                 'x_0', 'i0_deg', 'Ds_deg', 'material', 'csvfile',
+                 '_submodels', 'eps_void', 'eps_AM', 'sigma_s', 'A_s',
+                 'brugg_sol', 'brugg_liq', '_material', 'xm', 'xp', 'x', 'rm',
+                 'rp', 'r', '_wtm', '_wtp', '_w_x', '_w_AM', '_w_r', 'ptr',
+                 'x_ptr', 'xr_ptr', 'phi_0', 'g_hyst', 'hyst0']
+
     def __init__(self, name: str, **kwargs) -> None:
         """
         A class for the electrode-specific attributes and methods.
@@ -212,8 +237,6 @@ class Electrode:
             ========== =======================================================
 
         """
-        from . import submodels
-
         if name not in ['anode', 'cathode']:
             raise ValueError("'name' must be either 'anode' or 'cathode'.")
 
@@ -245,6 +268,9 @@ class Electrode:
             Hysteresis, opt = submodels.Hysteresis, all_submodels['Hysteresis']
             self._submodels['Hysteresis'] = Hysteresis(self, **opt)
 
+    def __deepcopy__(self, memo: dict) -> object:
+        return _deepcopy_shared(self, memo, ['_material'])
+
     def update(self) -> None:
         """
         Updates any secondary/dependent parameters. For the `Electrode`
@@ -258,16 +284,18 @@ class Electrode:
             `sigma_s = 10 * eps_s`
         * Specific particle surface area [m2/m3]:
             `A_s = 3 * eps_AM / R_s`
+        * Solid and liquid Bruggeman corrections [-]:
+            `brugg_sol = eps_s**p_sol`, `brugg_liq = eps_el**p_liq`
 
         """
-        import inspect
-        from .. import materials
-
         self.eps_void = 1. - self.eps_s - self.eps_el
         self.eps_AM = self.eps_s - self.eps_CBD
         self.sigma_s = 10. * self.eps_s
         self.A_s = 3. * self.eps_AM / self.R_s
 
+        self.brugg_sol = self.eps_s**self.p_sol
+        self.brugg_liq = self.eps_el**self.p_liq
+
         if self.eps_void < -np.finfo(float).eps:
             raise ValueError('eps_s + eps_el > 1.0')
 
@@ -339,6 +367,38 @@ class Electrode:
         """
         return self.i0_deg * self._material.get_i0(x, C_Li, T, fluxdir)
 
+    def get_sdot(self, eta: float | np.ndarray, i0: float | np.ndarray,
+                 T: float) -> float | np.ndarray:
+        """
+        Calculate the Butler-Volmer reaction rate given the overpotential
+        `eta`, exchange current density `i0`, and temperature `T`. Symmetric
+        reactions (`alpha_a == alpha_c`) use the equivalent `sinh` form.
+
+        Parameters
+        ----------
+        eta : float | 1D array
+            Overpotential [V].
+        i0 : float | 1D array
+            Exchange current density [A/m2].
+        T : float
+            Battery temperature [K].
+
+        Returns
+        -------
+        sdot : float | 1D array
+            Molar production rate of Li+ per unit surface area [kmol/m2/s].
+
+        """
+        c = _CONSTANTS
+
+        f_eta = c.F*eta / c.R / T
+
+        if self.alpha_a == self.alpha_c:
+            return 2.*i0 / c.F * np.sinh(self.alpha_a*f_eta)
+
+        return i0 / c.F * (np.exp(self.alpha_a*f_eta)
+                           - np.exp(-self.alpha_c*f_eta))
+
     def get_Eeq(self, x: float | np.ndarray) -> float | np.ndarray:
         """
         Calculate the equilibrium potential given the surface intercalation
@@ -397,12 +457,21 @@ class Electrode:
         batmods.mesh.x_ptr, batmods.mesh.xr_ptr, batmods.mesh.uniform_mesh
 
         """
-        from ..mesh import x_ptr, xr_ptr, uniform_mesh
-
         # Mesh locations
         self.xm, self.xp, self.x = uniform_mesh(self.thick, self.Nx, xshift)
         self.rm, self.rp, self.r = uniform_mesh(self.R_s, self.Nr)
 
+        self._wtm = 0.5*(self.rp[:-1] - self.rm[:-1]) / np.diff(self.r)
+
+        self._wtp = 0.5*(self.rp[1:] - self.rm[1:]) / np.diff(self.r)
+
+        # Volume weights for lithium totals, electrolyte and active material
+        # control volume widths [m] and particle-averaging r weights [-]
+        self._w_x = self.eps_el*(self.xp - self.xm)
+        self._w_AM = self.eps_AM*(self.xp - self.xm)
+        self._w_r = 4.*np.pi*self.r**2*(self.rp - self.rm) \
+                  / (4.*np.pi*self.R_s**3 / 3.)
+
         # Pointers
         # [[ptr_an], [ptr_sep], [ptr_ca]]
         # ptr_an and ptr_ca -> [[Li_ed(0->R_s)], phi_ed, Li_el, phi_el, ...]
@@ -435,16 +504,21 @@ class Electrode:
         x_ptr(self, xvars)
         xr_ptr(self, ['xs'])
 
-    def sv0(self, el: object) -> np.ndarray:
+    def sv0(self, el: object, out: np.ndarray = None) -> np.ndarray:
 
         start = self.ptr['start']
         size = self.ptr['size']
 
-        sv0 = np.zeros(size)
-        sv0[self.xr_ptr['xs'].flatten() - start] = self.x_0
-        sv0[self.x_ptr['phis'] - start] = self.phi_0
-        sv0[self.x_ptr['ce'] - start] = el.Li_0
-        sv0[self.x_ptr['phie'] - start] = el.phi_0
+        sv0 = np.zeros(size) if out is None else out
+
+        # Fill each x variable as a column of the (Nx, x_off) cell layout
+        cells = sv0.reshape(self.Nx, self.ptr['x_off'])
+
+        xs = self.ptr['xs'] - start
+        cells[:, xs:xs + self.Nr] = self.x_0
+        cells[:, self.ptr['phis'] - start] = self.phi_0
+        cells[:, self.ptr['ce'] - start] = el.Li_0
+        cells[:, self.ptr['phie'] - start] = el.phi_0
 
         for model in self._submodels.values():
             model.sv0(sv0)
@@ -461,10 +535,14 @@ class Electrode:
 
     def to_dict(self, soln: object) -> dict:
 
-        xs = np.zeros([soln.t.size, self.Nx, self.Nr])
-        for i in range(soln.t.size):
-            xs_tmp = soln.y[i, self.xr_ptr['xs'].flatten()]
-            xs[i, :, :] = xs_tmp.reshape([self.Nx, self.Nr])
+        # Particle states are Nr contiguous values in each (Nx, x_off) cell,
+        # so they are sliced from a reshaped view instead of fancy indexed
+        start, size = self.ptr['start'], self.ptr['size']
+        cells = soln.y[:, start:start + size].reshape(-1, self.Nx,
+                                                      self.ptr['x_off'])
+
+        xs0 = self.ptr['xs'] - start
+        xs = cells[:, :, xs0:xs0 + self.Nr].copy()
 
         ed_soln = {
             'x': self.x,
@@ -530,15 +608,14 @@ class Electrode:
         c, T = sim.c, bat.temp
 
         # calculate the boundary current using solid-phase cons. of charge
-        ed_soln = self.to_dict(soln)
-
-        phis = ed_soln['phis']
-        xs_R = ed_soln['xs'][:, :, -1]
-        phie = ed_soln['phie']
-        ce = ed_soln['ce']
+        # gather only the surface states, rather than all of to_dict()
+        phis = soln.y[:, self.x_ptr['phis']]
+        xs_R = soln.y[:, self.xr_ptr['xs'][:, -1]]
+        phie = soln.y[:, self.x_ptr['phie']]
+        ce = soln.y[:, self.x_ptr['ce']]
 
         if 'Hysteresis' in self._submodels:
-            hyst = ed_soln['hyst']
+            hyst = soln.y[:, self.x_ptr['hyst']]
             Hyst = self.get_Mhyst(xs_R)*hyst
         else:
             Hyst = 0.
@@ -547,17 +624,16 @@ class Electrode:
         fluxdir = -np.sign(eta)
 
         i0 = self.get_i0(xs_R, ce, T, fluxdir)
-        sdot = i0 / c.F * (  np.exp( self.alpha_a*c.F*eta / c.R / T)
-                           - np.exp(-self.alpha_c*c.F*eta / c.R / T)  )
+        sdot = self.get_sdot(eta, i0, T)
 
         if self._name == 'anode':
             i_ext = sdot[:, 0]*an.A_s*c.F*(an.xp[0] - an.xm[0]) \
-                  - an.sigma_s*an.eps_s**an.p_sol \
+                  - an.sigma_s*an.brugg_sol \
                       * (phis[:, 1] - phis[:, 0]) / (an.x[1] - an.x[0])
 
         elif self._name == 'cathode':
             i_ext = -sdot[:, -1]*ca.A_s*c.F*(ca.xp[-1] - ca.xm[-1]) \
-                  - ca.sigma_s*ca.eps_s**ca.p_sol \
+                  - ca.sigma_s*ca.brugg_sol \
                       * (phis[:, -1] - phis[:, -2]) / (ca.x[-1] - ca.x[-2])
 
         current_A = i_ext*bat.area
@@ -567,6 +643,9 @@ class Electrode:
 
 class Separator:
 
+    __slots__ = ['Nx', 'thick', 'eps_el', 'p_liq', 'eps_s', 'brugg_liq', 'xm',
+                 'xp', 'x', '_w_x', 'ptr', 'x_ptr']
+
     def __init__(self, **kwargs) -> None:
         """
         A class for the separator attributes and methods.
@@ -603,9 +682,12 @@ class Separator:
 
         * Solid-phase volume fraction [-]:
             `eps_s = 1 - eps_el`
+        * Liquid Bruggeman correction [-]:
+            `brugg_liq = eps_el**p_liq`
 
         """
         self.eps_s = 1 - self.eps_el
+        self.brugg_liq = self.eps_el**self.p_liq
 
     def make_mesh(self, xshift: float = 0., pshift: int = 0) -> None:
         """
@@ -624,11 +706,12 @@ class Separator:
         batmods.mesh.x_ptr, batmods.mesh.xr_ptr, batmods.mesh.uniform_mesh
 
         """
-        from ..mesh import x_ptr, uniform_mesh
-
         # Mesh locations
         self.xm, self.xp, self.x = uniform_mesh(self.thick, self.Nx, xshift)
 
+        # Electrolyte control volume widths [m], for lithium totals
+        self._w_x = self.eps_el*(self.xp - self.xm)
+
         # Pointers
         # [[ptr_an], Li_el, phi_el, ..., [ptr_ca]]
 
@@ -637,13 +720,24 @@ class Separator:
         self.ptr['phie'] = self.ptr['ce'] + 1
         self.ptr['x_off'] = 2
 
-        self.ptr['shift'] = self.Nx * self.ptr['x_off']
+        self.ptr['start'] = pshift
+        self.ptr['size'] = self.Nx * self.ptr['x_off']
+        self.ptr['shift'] = self.ptr['size']
 
         x_ptr(self, ['ce', 'phie'])
 
-    def sv0(self, el: object) -> np.ndarray:
-        import numpy as np
-        return np.tile([el.Li_0, el.phi_0], self.Nx)
+    def sv0(self, el: object, out: np.ndarray = None) -> np.ndarray:
+
+        start = self.ptr['start']
+        size = self.ptr['size']
+
+        sv0 = np.empty(size) if out is None else out
+
+        cells = sv0.reshape(self.Nx, self.ptr['x_off'])
+        cells[:, self.ptr['ce'] - start] = el.Li_0
+        cells[:, self.ptr['phie'] - start] = el.phi_0
+
+        return sv0
 
     def algidx(self) -> np.ndarray:
         return self.x_ptr['phie']
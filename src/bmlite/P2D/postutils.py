@@ -7,9 +7,11 @@ package.
 from typing import TypeVar
 
 import numpy as np
-import matplotlib.pyplot as plt
 
+from .dae import residuals
 from ._solutions import BaseSolution
+from .._utils import ExitHandler
+from ..plotutils import format_ticks, pixel, time_colorbar
 
 Solution = TypeVar('Solution', bound='BaseSolution')
 
@@ -46,8 +48,6 @@ def post(soln: Solution) -> dict:
     ~bmlite.P2D.solutions.CycleSolution
 
     """
-    from .dae import residuals
-
     # Pull sim and exp from soln
     sim = soln._sim
     step = {
@@ -70,11 +70,13 @@ def post(soln: Solution) -> dict:
     sum_ip = np.zeros([soln.t.size, an.Nx + sep.Nx + ca.Nx])
     i_el_x = np.zeros([soln.t.size, an.Nx + sep.Nx + ca.Nx + 1])
 
-    # Turn on output from residuals
+    # Turn on output from residuals, the residuals themselves are discarded
+    # so one scratch buffer is reused for every time
+    res = np.zeros(soln.y.shape[1])
     for i, t in enumerate(soln.t):
         sv, svdot = soln.y[i, :], soln.yp[i, :]
 
-        output = residuals(t, sv, svdot, np.zeros_like(sv), (sim, step))
+        output = residuals(t, sv, svdot, res, (sim, step))
 
         (div_i_an[i, :], div_i_sep[i, :], div_i_ca[i, :], sdot_an[i, :],
          sdot_ca[i, :], sum_ip[i, :], i_el_x[i, :]) = output
@@ -112,19 +114,18 @@ def _liquid_phase_Li(soln: Solution) -> np.ndarray:
     """
     el, an, sep, ca = soln._sim.el, soln._sim.an, soln._sim.sep, soln._sim.ca
 
+    # Volume-fraction weighted control volume widths [m]
+    w_an, w_sep, w_ca = an._w_x, sep._w_x, ca._w_x
+
     # Initial total liquid-phase lithium [kmol/m2]
-    Li_el_0 = np.sum(np.hstack([an.eps_el * el.Li_0 * (an.xp - an.xm),
-                                sep.eps_el * el.Li_0 * (sep.xp - sep.xm),
-                                ca.eps_el * el.Li_0 * (ca.xp - ca.xm)]))
+    Li_el_0 = el.Li_0*(np.sum(w_an) + np.sum(w_sep) + np.sum(w_ca))
 
     # Total liquid-phase lithium [kmol/m2] vs. time [s]
     Li_an = soln.vars['an']['ce']
     Li_sep = soln.vars['sep']['ce']
     Li_ca = soln.vars['ca']['ce']
 
-    Li_el_t = np.sum(np.hstack([an.eps_el * Li_an * (an.xp - an.xm),
-                                sep.eps_el * Li_sep * (sep.xp - sep.xm),
-                                ca.eps_el * Li_ca * (ca.xp - ca.xm)]), axis=1)
+    Li_el_t = Li_an @ w_an + Li_sep @ w_sep + Li_ca @ w_ca
 
     return Li_el_0, Li_el_t
 
@@ -152,27 +153,13 @@ def _solid_phase_Li(soln: Solution) -> np.ndarray:
     Li_ed_0 = an.x_0*an.Li_max*an.eps_AM*an.thick \
             + ca.x_0*ca.Li_max*ca.eps_AM*ca.thick
 
-    # Anode/cathode lithium [kmol/m2] vs. time [s]
-    V_an = 4.*np.pi*an.R_s**3 / 3.
-    V_ca = 4.*np.pi*ca.R_s**3 / 3.
-
-    dr_an = an.rp - an.rm
-    dr_ca = ca.rp - ca.rm
-
-    Li_an = np.zeros_like(soln.t)
-    Li_ca = np.zeros_like(soln.t)
-
-    for i in range(soln.t.size):
-
-        Li_ed_xr = soln.vars['an']['cs'][i, :, :]
-        Li_ed_x = np.sum(4.*np.pi*an.r**2 * Li_ed_xr*dr_an, axis=1) / V_an
+    # Radial (particle-averaging) and x (volume-fraction) weights
+    wr_an, wx_an = an._w_r, an._w_AM
+    wr_ca, wx_ca = ca._w_r, ca._w_AM
 
-        Li_an[i] = np.sum(an.eps_AM*Li_ed_x*(an.xp - an.xm))
-
-        Li_ed_xr = soln.vars['ca']['cs'][i, :, :]
-        Li_ed_x = np.sum(4.*np.pi*ca.r**2 * Li_ed_xr*dr_ca, axis=1) / V_ca
-
-        Li_ca[i] = np.sum(ca.eps_AM*Li_ed_x*(ca.xp - ca.xm))
+    # Contract (Nt, Nx, Nr) concentrations over r, then x
+    Li_an = soln.vars['an']['cs'] @ wr_an @ wx_an
+    Li_ca = soln.vars['ca']['cs'] @ wr_ca @ wx_ca
 
     # Total solid-phase lithium [kmol/m2] vs. time [s]
     Li_ed_t = Li_an + Li_ca
@@ -190,52 +177,37 @@ def potentials(soln: Solution) -> None:
         A pseudo-2D model solution object.
 
     """
-    import matplotlib.colors as clrs
-
-    from .._utils import ExitHandler
-    from ..plotutils import format_ticks
+    import matplotlib.pyplot as plt
 
     sep, ca = soln._sim.sep, soln._sim.ca
 
     # Pull time indices and setup colorbar
-    t_inds = np.ceil(np.linspace(0, soln.t.size - 1, 11)).astype(int)
-
-    norm = clrs.Normalize(vmin=soln.t.min(), vmax=soln.t.max())
-    sm = plt.cm.ScalarMappable(cmap='Greys', norm=norm)
+    t_inds, sm = time_colorbar(soln.t, 'Greys')
 
     # Phase potentials [V] vs. time [s]
     fig, ax = plt.subplots(nrows=1, ncols=1, figsize=[8, 3],
                            layout='constrained')
 
-    cmap = plt.get_cmap('Reds', len(t_inds))
-    for i, it in enumerate(t_inds):
-        if it != t_inds[-4]:
-            label = '__nolabel'
-        else:
-            label = r'$\phi_{\rm an}$'
-
-        ax.plot(soln.vars['an']['x']*1e6, soln.vars['an']['phis'][it, :],
-                color=cmap(i), label=label)
+    x_an = soln.vars['an']['x']*1e6
+    x_el = soln.vars['el']['x']*1e6
+    x_ca = soln.vars['ca']['x']*1e6
 
-    cmap = plt.get_cmap('Blues', len(t_inds))
+    cmap_an = plt.get_cmap('Reds', len(t_inds))
+    cmap_el = plt.get_cmap('Blues', len(t_inds))
+    cmap_ca = plt.get_cmap('Greens', len(t_inds))
     for i, it in enumerate(t_inds):
         if it != t_inds[-4]:
-            label = '__nolabel'
+            labels = ['__nolabel']*3
         else:
-            label = r'$\phi_{\rm el}$'
-
-        ax.plot(soln.vars['el']['x']*1e6, soln.vars['el']['phie'][it, :],
-                color=cmap(i), label=label)
+            labels = [r'$\phi_{\rm an}$', r'$\phi_{\rm el}$',
+                      r'$\phi_{\rm ca}$']
 
-    cmap = plt.get_cmap('Greens', len(t_inds))
-    for i, it in enumerate(t_inds):
-        if it != t_inds[-4]:
-            label = '__nolabel'
-        else:
-            label = r'$\phi_{\rm ca}$'
-
-        ax.plot(soln.vars['ca']['x']*1e6, soln.vars['ca']['phis'][it, :],
-                color=cmap(i), label=label)
+        ax.plot(x_an, soln.vars['an']['phis'][it, :], color=cmap_an(i),
+                label=labels[0])
+        ax.plot(x_el, soln.vars['el']['phie'][it, :], color=cmap_el(i),
+                label=labels[1])
+        ax.plot(x_ca, soln.vars['ca']['phis'][it, :], color=cmap_ca(i),
+                label=labels[2])
 
     cb = plt.colorbar(sm, ax=ax, ticks=soln.t[t_inds])
     cb.set_label(r'$t$ [s]')
@@ -269,20 +241,14 @@ def electrolyte(soln: Solution) -> None:
         A pseudo-2D model solution object.
 
     """
-    import matplotlib.colors as clrs
-
-    from .._utils import ExitHandler
-    from ..plotutils import format_ticks
+    import matplotlib.pyplot as plt
 
     sep, ca = soln._sim.sep, soln._sim.ca
 
     # Pull time indices and setup colorbar
-    t_inds = np.ceil(np.linspace(0, soln.t.size - 1, 11)).astype(int)
+    t_inds, sm = time_colorbar(soln.t, 'jet')
     cmap = plt.get_cmap('jet', len(t_inds))
 
-    norm = clrs.Normalize(vmin=soln.t.min(), vmax=soln.t.max())
-    sm = plt.cm.ScalarMappable(cmap='jet', norm=norm)
-
     # Electrolyte-phase Li-ion concentration [kmol/m3]
     fig, ax = plt.subplots(nrows=1, ncols=1, figsize=[8, 3],
                            layout='constrained')
@@ -321,18 +287,12 @@ def intercalation(soln: Solution) -> None:
         A pseudo-2D model solution object.
 
     """
-    import matplotlib.colors as clrs
-
-    from .._utils import ExitHandler
-    from ..plotutils import format_ticks
+    import matplotlib.pyplot as plt
 
     # Pull time indices and setup colorbar
-    t_inds = np.ceil(np.linspace(0, soln.t.size - 1, 11)).astype(int)
+    t_inds, sm = time_colorbar(soln.t, 'jet')
     cmap = plt.get_cmap('jet', len(t_inds))
 
-    norm = clrs.Normalize(vmin=soln.t.min(), vmax=soln.t.max())
-    sm = plt.cm.ScalarMappable(cmap='jet', norm=norm)
-
     # Solid-phase Li intercalation fracs [-]
     _, ax = plt.subplots(nrows=2, ncols=2, figsize=[8, 6],
                          layout='constrained')
@@ -386,8 +346,7 @@ def pixels(soln: Solution) -> None:
         A pseudo-2D model solution object.
 
     """
-    from ..plotutils import pixel
-    from .._utils import ExitHandler
+    import matplotlib.pyplot as plt
 
     # Get needed domains
     an, ca = soln._sim.an, soln._sim.ca
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import os
 import time
 
 from pathlib import Path
@@ -8,19 +7,28 @@ from copy import deepcopy
 from typing import TYPE_CHECKING
 
 import numpy as np
-import matplotlib.pyplot as plt
 
-from ruamel.yaml import YAML
+from .._core import Constants, IDASolver
+from .._core._idasolver import bandwidth
+from .._utils import (
+    ExitHandler, ProgressBar, short_warn, _param_key, _load_yaml,
+)
+from ..plotutils import format_ticks
+
+from .dae import residuals
+from .domains import Battery, Electrolyte, Electrode
+from ._solutions import StepSolution, CycleSolution
 
 if TYPE_CHECKING:  # pragma: no cover
     from bmlite import Experiment
-    from ._solutions import StepSolution, CycleSolution
+
+_TEMPLATES = Path(__file__).parent / 'templates'
 
 
 class Simulation:
 
     __slots__ = ['_yamlfile', '_yamlpath', '_t0', '_sv0', '_svdot0', '_lband',
-                 '_uband', '_algidx', 'c', 'bat', 'el', 'an', 'ca']
+                 '_uband', '_algidx', '_prekey', 'c', 'bat', 'el', 'an', 'ca']
 
     def __init__(self, yamlfile: str = 'graphite_nmc532') -> None:
         """
@@ -57,20 +65,17 @@ class Simulation:
             default template.
 
         """
-        from .. import Constants
-        from .._utils import short_warn
-        from .domains import Battery, Electrolyte, Electrode
-
         if '.yaml' not in yamlfile:
             yamlfile += '.yaml'
 
-        defaults = os.listdir(os.path.dirname(__file__) + '/templates')
-        if yamlfile in defaults:
-            path = os.path.dirname(__file__) + '/templates/' + yamlfile
+        # Only bare file names can refer to a packaged template, anything
+        # with a directory part (even './') is a user path
+        default = _TEMPLATES / yamlfile
+        if Path(yamlfile).name == yamlfile and default.is_file():
             short_warn(f"SPM Simulation: Using default {yamlfile}")
-            yamlpath = Path(path)
+            yamlpath = default
 
-        elif os.path.exists(yamlfile):
+        elif Path(yamlfile).is_file():
             yamlpath = Path(yamlfile)
 
         else:
@@ -79,8 +84,7 @@ class Simulation:
         self._yamlfile = yamlfile
         self._yamlpath = yamlpath
 
-        yaml = YAML(typ='safe')
-        yamldict = yaml.load(yamlpath)
+        yamldict = _load_yaml(yamlpath)
 
         self.c = Constants()
         self.bat = Battery(**yamldict['battery'])
@@ -89,6 +93,7 @@ class Simulation:
         self.ca = Electrode('cathode', **yamldict['cathode'])
 
         # Pre process dependent parameters, mesh, etc.
+        self._prekey = None
         self.pre()
 
     def pre(self) -> None:
@@ -109,6 +114,33 @@ class Simulation:
         if they do so. Otherwise, the dependent parameters may not be
         consistent with the user-defined inputs.
 
+        """
+        domains = (self.bat, self.el, self.an, self.ca)
+
+        # Skip the mesh, pointers, etc. if no parameters changed since the
+        # last pre(), e.g., when resetting the state at the end of run()
+        if _param_key(*domains) != self._prekey:
+            self._update_domains()
+
+        # Initialize potentials [V]
+        Eeq_an = self.an.get_Eeq(self.an.x_0)
+
+        self.an.phi_0 = 0.
+        self.el.phi_0 = -Eeq_an
+        self.ca.phi_0 = self.ca.get_Eeq(self.ca.x_0) - Eeq_an
+
+        # Initialize sv and svdot
+        self._t0 = 0.
+        self._sv0 = np.hstack([self.an.sv0(), self.el.sv0(), self.ca.sv0()])
+        self._svdot0 = np.zeros_like(self._sv0)
+
+        self._prekey = _param_key(*domains)
+
+    def _update_domains(self) -> None:
+        """
+        Update dependent parameters, meshes, pointers, algebraic indices, and
+        bandwidths. Called by `pre()` when any parameters have changed.
+
         """
         # Update dependent parameters
         self.bat.update()
@@ -121,22 +153,9 @@ class Simulation:
         self.el.make_mesh(pshift=self.an.ptr['shift'])
         self.ca.make_mesh(pshift=self.an.ptr['shift'] + self.el.ptr['shift'])
 
-        # Initialize potentials [V]
-        self.an.phi_0 = 0.
-
-        self.el.phi_0 = -self.an.get_Eeq(self.an.x_0)
-
-        self.ca.phi_0 = self.ca.get_Eeq(self.ca.x_0) \
-                      - self.an.get_Eeq(self.an.x_0)
-
-        # Initialize sv and svdot
-        self._t0 = 0.
-        self._sv0 = np.hstack([self.an.sv0(), self.el.sv0(), self.ca.sv0()])
-        self._svdot0 = np.zeros_like(self._sv0)
-
         # Algebraic indices
-        self._algidx = self.an.algidx().tolist() + self.el.algidx().tolist() \
-                     + self.ca.algidx().tolist()
+        self._algidx = np.concat([self.an.algidx(), self.el.algidx(),
+                                  self.ca.algidx()])
 
         # Determine the bandwidth
         # self._lband, self._uband, _ = bandwidth(self)
@@ -167,10 +186,7 @@ class Simulation:
             The upper half bandwidth. Only returned if `return_bands=True`.
 
         """
-        from .dae import residuals
-        from .._utils import ExitHandler
-        from .._core._idasolver import bandwidth
-        from bmlite.plotutils import format_ticks
+        import matplotlib.pyplot as plt
 
         t0 = 0.
         y0 = np.hstack([self.an.sv0(), self.el.sv0(), self.ca.sv0()])
@@ -243,25 +259,28 @@ class Simulation:
         makes it easier to fine tune solver options, and allows for analyses
         or control decisions in the middle of an experiment.
 
-        """
-        from bmlite import IDASolver
-
-        from .dae import residuals
-        from ._solutions import StepSolution
+        The SPM model defaults to the 'band' linear solver with half
+        bandwidths from `pre()`. Solver options given to the `Experiment`,
+        e.g., custom `lband` and `uband`, take precedence over these defaults.
 
+        """
         step = expr.steps[stepidx].copy()
-        options = expr._step_options[stepidx].copy()
 
         if not callable(step['value']):
             value = step['value']
             step['value'] = lambda t: value
 
-        options['userdata'] = (self, step)
-        options['calc_initcond'] = 'yp0'
-        options['algebraic_idx'] = self._algidx
-        options['linsolver'] = 'band'
-        options['lband'] = self._lband
-        options['uband'] = self._uband
+        options = {
+            'linsolver': 'band',
+            **expr._step_options[stepidx],
+            'userdata': (self, step),
+            'calc_initcond': 'yp0',
+            'algebraic_idx': self._algidx,
+        }
+
+        if 'band' in options['linsolver']:
+            options.setdefault('lband', self._lband)
+            options.setdefault('uband', self._uband)
 
         if step['limits'] is not None:
             _setup_eventsfn(step['limits'], options)
@@ -326,9 +345,6 @@ class Simulation:
         CycleSolution : Wrapper for an all-steps solution.
 
         """
-        from bmlite._utils import ProgressBar
-        from ._solutions import CycleSolution
-
         iterator = range(expr.num_steps)
         if bar:
             iterator = ProgressBar(iterator)
@@ -6,7 +6,6 @@ from copy import deepcopy
 from typing import Iterable, TYPE_CHECKING
 
 import numpy as np
-import matplotlib.pyplot as plt
 
 from bmlite import IDAResult
 
@@ -108,6 +107,7 @@ class BaseSolution(IDAResult):
             please refer to documentation for `maplotlib.pyplot.plot()`.
 
         """
+        import matplotlib.pyplot as plt
         from .._utils import ExitHandler
 
         plt.figure()
@@ -333,6 +333,8 @@ class BaseSolution(IDAResult):
         }
 
         if plot:
+            import matplotlib.pyplot as plt
+
             fig, ax = plt.subplots(nrows=1, ncols=3, figsize=[12, 3],
                                    layout='constrained')
 
@@ -8,6 +8,8 @@ so the `'band'` linear solver option can be used in the `IDASolver` class.
 
 import numpy as np
 
+from ..mathutils import grad_r, div_r
+
 if not hasattr(np, 'concat'):  # pragma: no cover
     np.concat = np.concatenate
 
@@ -52,8 +54,6 @@ def residuals(t: float, sv: np.ndarray, svdot: np.ndarray, res: np.ndarray,
         ========= =================================================
 
     """
-    from ..mathutils import grad_r, div_r
-
     # Break inputs into separate objects
     sim, exp = inputs
 
@@ -92,12 +92,11 @@ def residuals(t: float, sv: np.ndarray, svdot: np.ndarray, res: np.ndarray,
     fluxdir_an = -np.sign(eta)
 
     i0 = an.get_i0(xs_an[-1], el.Li_0, T, fluxdir_an)
-    sdot_an = i0 / c.F * (  np.exp( an.alpha_a*c.F*eta / c.R / T)
-                          - np.exp(-an.alpha_c*c.F*eta / c.R / T)  )
+    sdot_an = an.get_sdot(eta, i0, T)
 
     # Weighted solid particle properties
-    Ds_an = an._wtm*an.get_Ds(xs_an[:-1], T, fluxdir_an) \
-          + an._wtp*an.get_Ds(xs_an[1:], T, fluxdir_an)
+    Ds_an = an.get_Ds(xs_an, T, fluxdir_an)
+    Ds_an = an._wtm*Ds_an[:-1] + an._wtp*Ds_an[1:]
 
     # Solid-phase COM (differential)
     Js_an = np.concat([[0.], Ds_an*grad_r(an.r, Li_an), [-sdot_an]])
@@ -121,12 +120,11 @@ def residuals(t: float, sv: np.ndarray, svdot: np.ndarray, res: np.ndarray,
     fluxdir_ca = -np.sign(eta)
 
     i0 = ca.get_i0(xs_ca[-1], el.Li_0, T, fluxdir_ca)
-    sdot_ca = i0 / c.F * (  np.exp( ca.alpha_a*c.F*eta / c.R / T)
-                          - np.exp(-ca.alpha_c*c.F*eta / c.R / T)  )
+    sdot_ca = ca.get_sdot(eta, i0, T)
 
     # Weighted solid particle properties
-    Ds_ca = ca._wtm*ca.get_Ds(xs_ca[:-1], T, fluxdir_ca) \
-          + ca._wtp*ca.get_Ds(xs_ca[1:], T, fluxdir_ca)
+    Ds_ca = ca.get_Ds(xs_ca, T, fluxdir_ca)
+    Ds_ca = ca._wtm*Ds_ca[:-1] + ca._wtp*Ds_ca[1:]
 
     # Solid-phase COM (differential)
     Js_ca = np.concat([[0.], Ds_ca*grad_r(ca.r, Li_ca), [-sdot_ca]])
@@ -7,11 +7,24 @@ for the anode and cathode domains.
 
 """
 
+import inspect
+
 import numpy as np
 
+from . import submodels
+from .. import materials
+from .._core import Constants
+from .._utils import _deepcopy_shared
+from ..mesh import r_ptr, uniform_mesh
+
+# Read-only physical constants, shared so the residuals do not rebuild them
+_CONSTANTS = Constants()
+
 
 class Battery:
 
+    __slots__ = ['cap', 'temp', 'area']
+
     def __init__(self, **kwargs) -> None:
         """
         A class for battery-level attributes.
@@ -48,6 +61,8 @@ class Battery:
 
 class Electrolyte:
 
+    __slots__ = ['Li_0', 'ptr', 'phi_0']
+
     def __init__(self, **kwargs) -> None:
         """
         A class for the electrolyte attributes and methods.
@@ -99,6 +114,12 @@ class Electrolyte:
 
 class Electrode:
 
+    __slots__ = ['_name', 'Nr', 'thick', 'R_s', 'eps_s', 'eps_el', 'eps_CBD',
+                 'alpha_a', 'alpha_c', 'Li_max', 'x_0', 'i0_deg', 'Ds_deg',
+                 'material', 'csvfile', '_submodels', 'eps_void', 'eps_AM',
+                 'A_s', '_material', 'rm', 'rp', 'r', '_wtm', '_wtp', 'ptr',
+                 'r_ptr', 'phi_0', 'g_hyst', 'hyst0']
+
     def __init__(self, name: str, **kwargs):
         """
         A class for the electrode-specific attributes and methods.
@@ -135,8 +156,6 @@ class Electrode:
             ========== ======================================================
 
         """
-        from . import submodels
-
         if name not in ['anode', 'cathode']:
             raise ValueError("'name' must be either 'anode' or 'cathode'.")
 
@@ -165,6 +184,9 @@ class Electrode:
             Hysteresis, opt = submodels.Hysteresis, all_submodels['Hysteresis']
             self._submodels['Hysteresis'] = Hysteresis(self, **opt)
 
+    def __deepcopy__(self, memo: dict) -> object:
+        return _deepcopy_shared(self, memo, ['_material'])
+
     def update(self) -> None:
         """
         Updates any secondary/dependent parameters. For the `Electrode`
@@ -178,9 +200,6 @@ class Electrode:
             `A_s = 3 * eps_AM / R_s`
 
         """
-        import inspect
-        from .. import materials
-
         self.eps_void = 1. - self.eps_s - self.eps_el
         self.eps_AM = self.eps_s - self.eps_CBD
         self.A_s = 3. * self.eps_AM / self.R_s
@@ -254,6 +273,38 @@ class Electrode:
         """
         return self.i0_deg * self._material.get_i0(x, C_Li, T, fluxdir)
 
+    def get_sdot(self, eta: float | np.ndarray, i0: float | np.ndarray,
+                 T: float) -> float | np.ndarray:
+        """
+        Calculate the Butler-Volmer reaction rate given the overpotential
+        `eta`, exchange current density `i0`, and temperature `T`. Symmetric
+        reactions (`alpha_a == alpha_c`) use the equivalent `sinh` form.
+
+        Parameters
+        ----------
+        eta : float | 1D array
+            Overpotential [V].
+        i0 : float | 1D array
+            Exchange current density [A/m2].
+        T : float
+            Battery temperature [K].
+
+        Returns
+        -------
+        sdot : float | 1D array
+            Molar production rate of Li+ per unit surface area [kmol/m2/s].
+
+        """
+        c = _CONSTANTS
+
+        f_eta = c.F*eta / c.R / T
+
+        if self.alpha_a == self.alpha_c:
+            return 2.*i0 / c.F * np.sinh(self.alpha_a*f_eta)
+
+        return i0 / c.F * (np.exp(self.alpha_a*f_eta)
+                           - np.exp(-self.alpha_c*f_eta))
+
     def get_Eeq(self, x: float) -> float:
         """
         Calculate the equilibrium potential given the surface intercalation
@@ -306,8 +357,6 @@ class Electrode:
         batmods.mesh.r_ptr, batmods.mesh.uniform_mesh
 
         """
-        from ..mesh import r_ptr, uniform_mesh
-
         # Mesh locations
         self.rm, self.rp, self.r = uniform_mesh(self.R_s, self.Nr)
 
@@ -347,7 +396,7 @@ class Electrode:
         size = self.ptr['size']
 
         sv0 = np.zeros(size)
-        sv0[self.r_ptr['xs'] - start] = self.x_0*np.ones(self.Nr)
+        sv0[self.r_ptr['xs'] - start] = self.x_0
         sv0[self.ptr['phis'] - start] = self.phi_0
 
         for model in self._submodels.values():
@@ -449,8 +498,7 @@ class Electrode:
         fluxdir = -np.sign(eta)
 
         i0 = self.get_i0(xs_R, el.Li_0, T, fluxdir)
-        sdot = i0 / c.F * (  np.exp( self.alpha_a*c.F*eta / c.R / T)
-                           - np.exp(-self.alpha_c*c.F*eta / c.R / T)  )
+        sdot = self.get_sdot(eta, i0, T)
 
         i_ext = sign*sdot*self.A_s*self.thick*c.F
         current_A = i_ext*bat.area
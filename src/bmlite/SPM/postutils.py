@@ -7,9 +7,12 @@ package.
 from typing import TypeVar
 
 import numpy as np
-import matplotlib.pyplot as plt
 
+from .dae import residuals
 from ._solutions import BaseSolution
+from ..mathutils import int_r
+from .._utils import ExitHandler
+from ..plotutils import format_ticks, pixel, time_colorbar
 
 Solution = TypeVar('Solution', bound='BaseSolution')
 
@@ -41,8 +44,6 @@ def post(soln: Solution) -> dict:
     ~bmlite.SPM.solutions.CycleSolution
 
     """
-    from .dae import residuals
-
     # Pull sim and exp from sol
     sim = soln._sim
     step = {
@@ -55,11 +56,13 @@ def post(soln: Solution) -> dict:
     sdot_an = np.zeros_like(soln.t)
     sdot_ca = np.zeros_like(soln.t)
 
-    # Turn on output from residuals
+    # Turn on output from residuals, the residuals themselves are discarded
+    # so one scratch buffer is reused for every time
+    res = np.zeros(soln.y.shape[1])
     for i, t in enumerate(soln.t):
         sv, svdot = soln.y[i, :], soln.yp[i, :]
 
-        output = residuals(t, sv, svdot, np.zeros_like(sv), (sim, step))
+        output = residuals(t, sv, svdot, res, (sim, step))
         sdot_an[i], sdot_ca[i] = output
 
     # Store outputs
@@ -93,8 +96,6 @@ def _solid_phase_Li(soln: Solution) -> np.array:
     ~bmlite.SPM.solutions.CycleSolution
 
     """
-    from ..mathutils import int_r
-
     an, ca = soln._sim.an, soln._sim.ca
 
     # Initial total solid-phase lithium [kmol/m2]
@@ -135,8 +136,7 @@ def potentials(soln: Solution) -> None:
     ~bmlite.SPM.solutions.CycleSolution
 
     """
-    from .._utils import ExitHandler
-    from ..plotutils import format_ticks
+    import matplotlib.pyplot as plt
 
     fig, ax = plt.subplots(nrows=1, ncols=3, figsize=[12, 3],
                            layout='constrained')
@@ -174,10 +174,7 @@ def intercalation(soln: Solution) -> None:
     ~bmlite.SPM.solutions.CycleSolution
 
     """
-    import matplotlib.colors as clrs
-
-    from .._utils import ExitHandler
-    from ..plotutils import format_ticks
+    import matplotlib.pyplot as plt
 
     # Pull sim and exp from sol
     sim = soln._sim
@@ -186,12 +183,9 @@ def intercalation(soln: Solution) -> None:
     an, ca = sim.an, sim.ca
 
     # Pull time indices and setup colorbar
-    t_inds = np.ceil(np.linspace(0, soln.t.size - 1, 11)).astype(int)
+    t_inds, sm = time_colorbar(soln.t, 'jet')
     cmap = plt.get_cmap('jet', len(t_inds))
 
-    norm = clrs.Normalize(vmin=soln.t.min(), vmax=soln.t.max())
-    sm = plt.cm.ScalarMappable(cmap='jet', norm=norm)
-
     # Solid-phase Li intercalation fracs -- anode and cathode
     fig, ax = plt.subplots(nrows=1, ncols=2, figsize=[8, 3],
                            layout='constrained')
@@ -239,8 +233,7 @@ def pixels(soln: Solution) -> None:
     ~bmlite.SPM.solutions.CycleSolution
 
     """
-    from ..plotutils import pixel
-    from .._utils import ExitHandler
+    import matplotlib.pyplot as plt
 
     # Get needed domains
     an, ca = soln._sim.an, soln._sim.ca
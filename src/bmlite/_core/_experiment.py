@@ -187,7 +187,7 @@ class Experiment:
         elif not isinstance(tspan, np.ndarray):
             raise TypeError("'tspan' must be type float, tuple, or np.array.")
 
-        tspan = np.asarray(tspan, dtype=float)
+        tspan = np.ascontiguousarray(tspan, dtype=float)
 
         if tspan.ndim != 1:
             raise ValueError("'tspan' must be one-dimensional.")
@@ -195,7 +195,7 @@ class Experiment:
             raise ValueError("'tspan[0]' must be zero.")
         elif tspan.size < 2:
             raise ValueError("'tspan' array length must be at least two.")
-        elif not all(np.diff(tspan) > 0.):
+        elif not np.all(np.diff(tspan) > 0.):
             raise ValueError("'tspan' must be monotonically increasing.")
 
         step = {}
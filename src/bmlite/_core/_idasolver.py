@@ -5,7 +5,6 @@ from warnings import warn
 from typing import TYPE_CHECKING
 
 import numpy as np
-from scipy import linalg
 from sksundae import ida
 
 if TYPE_CHECKING:  # pragma: no cover
@@ -31,6 +30,9 @@ def bandwidth(resfn: Callable, t0: float, y0: ArrayLike, yp0: ArrayLike,
     and `yp0` to approximate a Jacobian pattern. The pattern is then used to
     find the lower and upper half bandwidths.
 
+    Each column is perturbed on its own, which takes `m` calls to `resfn`
+    but makes no assumption about the band, so any coupling is found.
+
     Parameters
     ----------
     resfn : Callable
@@ -80,8 +82,11 @@ def bandwidth(resfn: Callable, t0: float, y0: ArrayLike, yp0: ArrayLike,
         raise ValueError("'resfn' signature must have either 4 or 5 inputs.")
 
     # Perturbed variables
-    y = np.array(y0)
-    yp = np.array(yp0)
+    y0 = np.asarray(y0, dtype=float)
+    yp0 = np.asarray(yp0, dtype=float)
+
+    y = y0.copy()
+    yp = yp0.copy()
 
     # Initial residuals
     res = np.zeros_like(y)
@@ -92,7 +97,7 @@ def bandwidth(resfn: Callable, t0: float, y0: ArrayLike, yp0: ArrayLike,
     rng = np.random.default_rng(seed=42)
     rand = rng.random(2)
 
-    # Jacobian pattern
+    # Jacobian pattern, one column at a time
     def j_pattern(j):
         y_store, yp_store = y[j], yp[j]
 
@@ -102,15 +107,24 @@ def bandwidth(resfn: Callable, t0: float, y0: ArrayLike, yp0: ArrayLike,
 
         y[j], yp[j] = y_store, yp_store
 
-        return np.where(res_0 - res != 0, 1, 0)
+        return np.flatnonzero(res_0 - res != 0)
 
-    j_cols = [j_pattern(j) for j in range(y.size)]
-    j_pat = np.column_stack(j_cols)
+    j_rows = [j_pattern(j) for j in range(y.size)]
 
-    # Find lband and uband
-    output = linalg.bandwidth(j_pat)
+    rows = np.concatenate(j_rows)
+    cols = np.repeat(np.arange(y.size), [i.size for i in j_rows])
+
+    # Find lband and uband from the nonzero offsets
+    offsets = cols - rows
+    output = (
+        max(0, -int(offsets.min(initial=0))),
+        max(0, int(offsets.max(initial=0))),
+    )
 
     if return_pattern:
+        j_pat = np.zeros((y.size, y.size), dtype=int)
+        j_pat[rows, cols] = 1
+
         output += (j_pat,)
 
     return output
@@ -1,4 +1,4 @@
-import os
+from pathlib import Path
 
 import bmlite as bm
 
@@ -27,14 +27,14 @@ def templates(model: str, file: str | int = None) -> None:
 
     """
     try:
-        path = getattr(bm, model.upper()).__path__[0]
+        path = Path(getattr(bm, model.upper()).__path__[0]) / 'templates'
     except AttributeError:
         raise AttributeError(f"{model=} is not a valid subpackage.") from None
 
-    if not os.path.exists(path + '/templates/'):  # pragma: no cover
+    if not path.is_dir():  # pragma: no cover
         raise FileNotFoundError(f"{model=} has no 'templates' directory.")
 
-    templates = os.listdir(path + '/templates/')
+    templates = [f.name for f in path.iterdir()]
 
     if file is None:
 
@@ -51,5 +51,4 @@ def templates(model: str, file: str | int = None) -> None:
     if file is not None:
 
         print('='*30, file, '='*30, sep='\n')
-        with open(path + '/templates/' + file, 'r') as f:
-            print(f.read())
+        print((path / file).read_text())
@@ -4,9 +4,14 @@ import textwrap
 import copy as _copy
 import types as _types
 
+from numbers import Number
+from pathlib import Path
 from typing import Any, Callable, Iterable
 
+import numpy as np
+
 from tqdm import tqdm
+from ruamel.yaml import YAML
 
 # As of scipy 1.18, interpolants (e.g. scipy.interpolate.CubicSpline, used by
 # the intercalation materials as '_Eeq_spline') cache the array-API namespace
@@ -181,6 +186,41 @@ def short_warn(message, category=UserWarning, filename='None', lineno=0):
     warnings.formatwarning = original_format
 
 
+_YAML_CACHE: dict[Path, tuple[int, dict]] = {}
+
+
+def _load_yaml(path: str | Path) -> dict:
+    """
+    Load a `.yaml` file, reusing a cached parse when it has not changed.
+
+    Parsed files are cached by resolved path and stored with their
+    modification time, so an edited file is always re-read. A deep copy
+    of the cached dictionary is returned so callers can modify it freely.
+    A new `YAML` parser is made for each miss because parsers hold state
+    and are not thread safe.
+
+    Parameters
+    ----------
+    path : str | Path
+        Path to the `.yaml` file.
+
+    Returns
+    -------
+    yamldict : dict
+        Parsed contents of the file.
+
+    """
+    path = Path(path).resolve()
+    mtime = path.stat().st_mtime_ns
+
+    cached = _YAML_CACHE.get(path)
+    if cached is None or cached[0] != mtime:
+        cached = (mtime, YAML(typ='safe').load(path))
+        _YAML_CACHE[path] = cached
+
+    return _copy.deepcopy(cached[1])
+
+
 def _repr(name: str, keys: list[str], values: list[Any]) -> str:
     """
     Return a readable repr string.
@@ -204,3 +244,112 @@ def _repr(name: str, keys: list[str], values: list[Any]) -> str:
     summary = textwrap.indent(summary, " " * 4)
 
     return f"{name}(\n{summary}\n)"
+
+
+def _param_key(*objs: object) -> tuple:
+    """
+    Return a hashable key built from the parameter attributes of each object.
+
+    Attributes are keyed according to the following rules:
+
+    * `str`, `None`, and numeric (`numbers.Number`, including `bool`, and
+      numpy scalar or 0-d array) values are included. Numpy values are
+      converted to their Python equivalents with `.item()`.
+    * Arrays, dicts, and private attributes (meshes, pointers, materials,
+      etc.) are skipped. These are rebuilt from the parameters by `update()`
+      and `make_mesh()`.
+    * Attached `_submodels` are included by name, type, and their own key.
+    * Any other value (e.g., a `Path`) is included if hashable. Otherwise, a
+      unique placeholder is used so the key never matches a previous one,
+      forcing a full rebuild.
+
+    Parameters
+    ----------
+    *objs : object
+        Objects whose attributes should be included in the key. Attributes
+        are collected from both `__dict__` and `__slots__`, if present.
+
+    Returns
+    -------
+    key : tuple
+        A tuple with one sorted tuple of `(name, value)` pairs per object.
+
+    """
+    key = []
+    for obj in objs:
+        names = set(getattr(obj, '__dict__', {}))
+        for cls in type(obj).__mro__:
+            names.update(getattr(cls, '__slots__', ()))
+
+        items = []
+        for name in sorted(names):
+            value = getattr(obj, name, None)
+            if name == '_submodels':
+                value = tuple(
+                    (k, type(model).__name__, _param_key(model))
+                    for k, model in sorted(value.items())
+                )
+            elif isinstance(value, (np.generic, np.ndarray)):
+                if value.ndim != 0:
+                    continue
+
+                value = value.item()
+            elif isinstance(value, dict) or name.startswith('_'):
+                continue
+
+            try:
+                hash(value)
+            except TypeError:
+                value = object()
+
+            items.append((name, value))
+
+        key.append(tuple(items))
+
+    return tuple(key)
+
+
+def _deepcopy_shared(obj: object, memo: dict, shared: Iterable[str]) -> object:
+    """
+    Deep copy an object, but share selected attributes with the original.
+
+    Intended for `__deepcopy__` methods of domain classes, where attributes
+    like `_material` are never modified in place and are rebuilt by
+    `update()`. Sharing them avoids recursively copying spline interpolants.
+
+    Parameters
+    ----------
+    obj : object
+        The instance to copy. Attributes are collected from both `__dict__`
+        and `__slots__`, if present.
+    memo : dict
+        The `deepcopy` memo dictionary.
+    shared : Iterable[str]
+        Names of attributes to assign by reference rather than copy.
+
+    Returns
+    -------
+    new : object
+        A copy of `obj`.
+
+    """
+    cls = type(obj)
+
+    new = cls.__new__(cls)
+    memo[id(obj)] = new
+
+    names = list(getattr(obj, '__dict__', {}))
+    for base in cls.__mro__:
+        names.extend(getattr(base, '__slots__', ()))
+
+    for name in names:
+        if name == '__dict__' or not hasattr(obj, name):
+            continue
+
+        value = getattr(obj, name)
+        if name not in shared:
+            value = _copy.deepcopy(value, memo)
+
+        setattr(new, name, value)
+
+    return new
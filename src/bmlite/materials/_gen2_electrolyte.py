@@ -1,3 +1,4 @@
+import numpy as np
 from numpy import ndarray as _ndarray
 
 
@@ -33,8 +34,6 @@ class Gen2Electrolyte:
             Lithium ion diffusivity in the electrolyte [m2/s].
 
         """
-        import numpy as np
-
         A = np.array([[-0.568822600, 1607.003, -24.83763, 64.07366],
                       [-0.810872100, 475.2910, -24.83763, 64.07366],
                       [-0.005192312, 33.43827, -24.83763, 64.07366]])
@@ -65,8 +64,6 @@ class Gen2Electrolyte:
             Lithium ion transference number [-].
 
         """
-        import numpy as np
-
         A = np.array([[-0.0000002876102,  0.0002077407, -0.03881203],
                       [ 0.0000011614630, -0.0008682500,  0.17772660],
                       [-0.0000006766258,  0.0006389189,  0.30917610]])
@@ -95,8 +92,6 @@ class Gen2Electrolyte:
             Electrolyte conductivity [S/m].
 
         """
-        import numpy as np
-
         A = np.array([
         [ 0.,           0.,           1.909446e-4, -8.038545e-2,  9.003410e+0],
         [-2.887587e-8,  3.483638e-5, -1.583677e-2,  3.195295e+0, -2.414638e+2],
@@ -128,8 +123,6 @@ class Gen2Electrolyte:
             Thermodynamic factor [-].
 
         """
-        import numpy as np
-
         gamma = 0.54000*np.exp(329./T)*C_Li**2 - 0.00225*np.exp(1360./T)*C_Li \
               + 0.34100*np.exp(261./T)
 
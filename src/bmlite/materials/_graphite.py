@@ -2,6 +2,8 @@ from numbers import Real
 
 import numpy as np
 
+from .._core import Constants
+
 
 class GraphiteFast:
 
@@ -49,8 +51,6 @@ class GraphiteFast:
             Lithium diffusivity in the solid phase [m2/s].
 
         """
-        from .. import Constants
-
         c = Constants()
 
         Ds = 3e-14 * np.exp(-30e6 / c.R * (1 / T - 1 / 303.15))
@@ -88,8 +88,6 @@ class GraphiteFast:
             Exchange current density [A/m2].
 
         """
-        from .. import Constants
-
         c = Constants()
 
         # Avoid floating point errors
@@ -97,8 +95,8 @@ class GraphiteFast:
             if (x < 0 and self.alpha_c < 1) or (x > 1 and self.alpha_a < 1):
                 raise ValueError('x is out of [0, 1] during i0 calculation')
         elif isinstance(x, np.ndarray):
-            if ((any(x.flatten() < 0) and self.alpha_c < 1)
-               or (any(x.flatten() > 1) and self.alpha_a < 1)):
+            if ((np.any(x < 0) and self.alpha_c < 1)
+               or (np.any(x > 1) and self.alpha_a < 1)):
                 raise ValueError('x is out of [0, 1] during i0 calculation')
 
         i0 = 2.5 * 0.27 * np.exp(-30e6 / c.R * (1 / T - 1 / 303.15)) \
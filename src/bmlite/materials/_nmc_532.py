@@ -1,5 +1,7 @@
 import numpy as np
 
+from .._core import Constants
+
 
 class NMC532Fast:
 
@@ -47,8 +49,6 @@ class NMC532Fast:
             Lithium diffusivity in the solid phase [m2/s].
 
         """
-        from .. import Constants
-
         c = Constants()
 
         A = np.array([
@@ -98,8 +98,6 @@ class NMC532Fast:
             Exchange current density [A/m2].
 
         """
-        from .. import Constants
-
         c = Constants()
 
         A = np.array([
@@ -1,5 +1,7 @@
 import numpy as np
 
+from .._core import Constants
+
 
 class NMC811:
 
@@ -51,8 +53,6 @@ class NMC811:
             Lithium diffusivity in the solid phase [m2/s].
 
         """
-        from .. import Constants
-
         c = Constants()
         A = np.array([
             -2.509010843479270e+2,
@@ -108,8 +108,6 @@ class NMC811:
             Exchange current density [A/m2].
 
         """
-        from .. import Constants
-
         c = Constants()
         A = np.array([
              1.650452829641290e+1,
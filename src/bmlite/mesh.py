@@ -42,12 +42,13 @@ def x_ptr(domain: object, keys: list[str]) -> dict:
         list should be a subset of the domain's existing `ptr` keys.
 
     """
-    from numpy import array
+    from numpy import arange
+
+    offsets = arange(domain.Nx, dtype=int) * domain.ptr['x_off']
 
     domain.x_ptr = {}
     for k in keys:
-        domain.x_ptr[k] = array([domain.ptr[k] + i * domain.ptr['x_off']
-                                 for i in range(domain.Nx)], dtype=int)
+        domain.x_ptr[k] = domain.ptr[k] + offsets
 
 
 def r_ptr(domain: object, keys: list[str]) -> None:
@@ -75,12 +76,13 @@ def r_ptr(domain: object, keys: list[str]) -> None:
         list should be a subset of the domain's existing `ptr` keys.
 
     """
-    from numpy import array
+    from numpy import arange
+
+    offsets = arange(domain.Nr, dtype=int) * domain.ptr['r_off']
 
     domain.r_ptr = {}
     for k in keys:
-        domain.r_ptr[k] = array([domain.ptr[k] + j * domain.ptr['r_off']
-                                 for j in range(domain.Nr)], dtype=int)
+        domain.r_ptr[k] = domain.ptr[k] + offsets
 
 
 def xr_ptr(domain: object, keys: list[str]) -> None:
@@ -109,17 +111,14 @@ def xr_ptr(domain: object, keys: list[str]) -> None:
         `ptr` keys.
 
     """
-    from numpy import array, tile
+    from numpy import arange
+
+    offsets = arange(domain.Nx, dtype=int)[:, None] * domain.ptr['x_off'] \
+            + arange(domain.Nr, dtype=int)[None, :] * domain.ptr['r_off']
 
     domain.xr_ptr = {}
     for k in keys:
-        first_row = array([domain.ptr[k] + j * domain.ptr['r_off']
-                           for j in range(domain.Nr)], dtype=int)
-
-        domain.xr_ptr[k] = tile(first_row, (domain.Nx, 1))
-
-        for i in range(domain.Nx):
-            domain.xr_ptr[k][i, :] += i * domain.ptr['x_off']
+        domain.xr_ptr[k] = domain.ptr[k] + offsets
 
 
 def uniform_mesh(Lx: float, Nx: int, x0: float = 0.) -> tuple[_ndarray]:
@@ -159,9 +158,15 @@ def uniform_mesh(Lx: float, Nx: int, x0: float = 0.) -> tuple[_ndarray]:
     """
     from numpy import linspace
 
-    xm = x0 + linspace(0., Lx * (1 - 1 / Nx), Nx)
-    xp = x0 + linspace(Lx / Nx, Lx, Nx)
-    x = 0.5 * (xm + xp)
+    xm = linspace(0., Lx * (1 - 1 / Nx), Nx)
+    xp = linspace(Lx / Nx, Lx, Nx)
+
+    if x0:
+        xm += x0
+        xp += x0
+
+    x = xm + xp
+    x *= 0.5
 
     return xm, xp, x
 
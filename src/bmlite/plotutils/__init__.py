@@ -67,3 +67,36 @@ def pixel(ax: object, xlims: list[float], ylims: list[float], z: np.ndarray,
     cb = plt.colorbar(im, ax=ax)
     cb.ax.yaxis.set_offset_position('left')
     cb.set_label(cblabel)
+
+
+def time_colorbar(t: np.ndarray, cmap: str, n: int = 11) -> tuple:
+    """
+    Select `n` evenly spaced time indices and build a mappable for a time
+    colorbar, as shared by the profile plots in `postutils`.
+
+    Parameters
+    ----------
+    t : 1D array
+        Solution times [s].
+    cmap : str
+        Name of a `matplotlib` colormap for the colorbar.
+    n : int, optional
+        Number of time indices to select. The default is 11.
+
+    Returns
+    -------
+    t_inds : 1D array
+        Integer indices into `t`, including the first and last times.
+    sm : object
+        A `ScalarMappable` normalized from `t.min()` to `t.max()`.
+
+    """
+    import matplotlib.pyplot as plt
+    import matplotlib.colors as clrs
+
+    t_inds = np.ceil(np.linspace(0, t.size - 1, n)).astype(int)
+
+    norm = clrs.Normalize(vmin=t.min(), vmax=t.max())
+    sm = plt.cm.ScalarMappable(cmap=cmap, norm=norm)
+
+    return t_inds, sm
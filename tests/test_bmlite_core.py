@@ -46,3 +46,22 @@ def test_templates():
     bm.templates('p2d', 'graphite_nmc532.yaml')
 
     assert True
+
+
+def test_bandwidth_out_of_band():
+    import numpy as np
+    from bmlite._core._idasolver import bandwidth
+
+    # Tridiagonal Jacobian with one far off-diagonal coupling
+    N = 20
+    J = np.eye(N) + np.eye(N, k=1) + np.eye(N, k=-1)
+    J[8, 0] = 1.
+
+    def resfn(t, y, yp, res):
+        res[:] = J @ y + yp
+
+    y0, yp0 = np.ones(N), np.zeros(N)
+    lband, uband, j_pat = bandwidth(resfn, 0., y0, yp0, return_pattern=True)
+
+    assert (lband, uband) == (8, 1)
+    assert np.all(j_pat == (J != 0))
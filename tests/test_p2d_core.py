@@ -1,4 +1,5 @@
 import pytest
+import numpy as np
 import bmlite as bm
 import matplotlib.pyplot as plt
 
@@ -19,6 +20,19 @@ def test_fake_yaml():
         _ = bm.SPM.Simulation('fake.yaml')
 
 
+def test_local_yaml(tmp_path, monkeypatch):
+    from pathlib import Path
+
+    template = Path(bm.P2D.__file__).parent / 'templates/graphite_nmc532.yaml'
+    text = template.read_text().replace('1.89e-2', '99.0', 1)
+
+    (tmp_path / 'graphite_nmc532.yaml').write_text(text)
+    monkeypatch.chdir(tmp_path)
+
+    sim = bm.P2D.Simulation('./graphite_nmc532.yaml')
+    assert sim.bat.cap == 99.0
+
+
 def test_j_pattern(sim):
     with plt.ioff():
         lband, uband = sim.j_pattern(return_bands=True)
@@ -32,3 +46,98 @@ def test_j_pattern(sim):
 def test_copy(sim):
     sim2 = sim.copy()
     assert all(sim2._sv0 == sim._sv0)
+
+    assert sim2.an is not sim.an
+    assert sim2.an.x is not sim.an.x
+    assert sim2.an._material is sim.an._material
+
+
+def test_sparsity(sim):
+    from bmlite.P2D.dae import residuals
+
+    step = {'mode': 'current', 'units': 'C', 'value': lambda t: 0.}
+
+    # Reference pattern, perturbing one column at a time
+    y0 = sim._rested_state()
+    yp0 = np.zeros_like(y0)
+
+    res_0, res = np.zeros_like(y0), np.zeros_like(y0)
+    residuals(0., y0, yp0, res_0, (sim, step))
+
+    j_pat = np.zeros((y0.size, y0.size), dtype=int)
+    for j in range(y0.size):
+        y, yp = y0.copy(), yp0.copy()
+        y[j] += max(1e-6, 1e-6*abs(y[j]))
+        yp[j] += 1e-6
+
+        residuals(0., y, yp, res, (sim, step))
+        j_pat[:, j] = res != res_0
+
+    j_pat[np.diag_indices_from(j_pat)] = 1
+
+    assert np.all(sim._sparsity().toarray() == j_pat)
+
+
+def test_pre_cache(sim):
+    sim2 = sim.copy()
+
+    x = sim2.an.x
+    sim2.pre()
+    assert sim2.an.x is x
+
+    sim2.an.Nx += 1
+    sim2.pre()
+    assert sim2.an.x.size == sim.an.x.size + 1
+    assert sim2._sv0.size > sim._sv0.size
+
+
+def test_pre_cache_numpy_scalars(sim):
+    sim2 = sim.copy()
+
+    for Nx in np.arange(5, 20, 5):
+        sim2.an.Nx = Nx
+        sim2.pre()
+        assert sim2.an.x.size == Nx
+
+    for eps_s in np.array([0.5, 0.55], dtype=np.float32):
+        sim2.an.eps_s = eps_s
+        sim2.pre()
+        assert sim2.an.A_s == 3.*(eps_s - sim2.an.eps_CBD) / sim2.an.R_s
+
+
+def test_pre_cache_submodels():
+    with pytest.warns(UserWarning):
+        sim = bm.P2D.Simulation('graphite_lfp')
+
+    sim.ca.hyst0 = 0.5
+    sim.pre()
+    assert np.all(sim._sv0[sim.ca.x_ptr['hyst']] == 0.5)
+
+    size = sim._sv0.size
+
+    del sim.ca._submodels['Hysteresis']
+    sim.pre()
+    assert 'hyst' not in sim.ca.x_ptr
+    assert sim._sv0.size == size - sim.ca.Nx
+
+
+def test_pickle(sim):
+    import pickle
+
+    sim._sparsity()
+    sim2 = pickle.loads(pickle.dumps(sim))
+
+    assert all(sim2._sv0 == sim._sv0)
+    assert sim2._jpat.nnz == sim._jpat.nnz
+
+    x = sim2.an.x
+    sim2.pre()
+    assert sim2.an.x is x
+
+
+def test_domain_slots(sim):
+    for domain in [sim.bat, sim.el, sim.an, sim.sep, sim.ca]:
+        assert not hasattr(domain, '__dict__')
+
+    with pytest.raises(AttributeError):
+        sim.an.eps_typo = 0.
@@ -61,3 +61,27 @@ def test_dynamic_load(soln):
 
 def test_event_switches(soln):
     assert soln.status.count(2) == 3
+
+
+def test_band_override(sim, monkeypatch):
+    from bmlite.P2D import _simulation
+
+    options = {}
+
+    class Solver(_simulation.IDASolver):
+        def __init__(self, resfn, **kwargs):
+            options.update(kwargs)
+            super().__init__(resfn, **kwargs)
+
+    monkeypatch.setattr(_simulation, 'IDASolver', Solver)
+
+    expr = bm.Experiment(linsolver='band', lband=sim._lband + 1)
+    expr.add_step('current_C', 1., (600., 60.))
+
+    soln = sim.run(expr)
+    assert soln.success
+
+    assert options['linsolver'] == 'band'
+    assert options['lband'] == sim._lband + 1
+    assert options['uband'] == sim._uband
+    assert 'sparsity' not in options
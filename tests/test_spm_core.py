@@ -19,6 +19,19 @@ def test_fake_yaml():
         _ = bm.SPM.Simulation('fake.yaml')
 
 
+def test_local_yaml(tmp_path, monkeypatch):
+    from pathlib import Path
+
+    template = Path(bm.SPM.__file__).parent / 'templates/graphite_nmc532.yaml'
+    text = template.read_text().replace('1.89e-2', '99.0', 1)
+
+    (tmp_path / 'graphite_nmc532.yaml').write_text(text)
+    monkeypatch.chdir(tmp_path)
+
+    sim = bm.SPM.Simulation('./graphite_nmc532.yaml')
+    assert sim.bat.cap == 99.0
+
+
 def test_j_pattern(sim):
     with plt.ioff():
         lband, uband = sim.j_pattern(return_bands=True)
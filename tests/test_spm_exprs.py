@@ -61,3 +61,37 @@ def test_dynamic_load(soln):
 
 def test_event_switches(soln):
     assert soln.status.count(2) == 3
+
+
+def test_band_override(sim, monkeypatch):
+    from bmlite.SPM import _simulation
+
+    options = {}
+
+    class Solver(_simulation.IDASolver):
+        def __init__(self, resfn, **kwargs):
+            options.update(kwargs)
+            super().__init__(resfn, **kwargs)
+
+    monkeypatch.setattr(_simulation, 'IDASolver', Solver)
+
+    expr = bm.Experiment(lband=sim._lband + 1)
+    expr.add_step('current_C', 1., (600., 60.))
+
+    soln = sim.run(expr)
+    assert soln.success
+
+    assert options['linsolver'] == 'band'
+    assert options['lband'] == sim._lband + 1
+    assert options['uband'] == sim._uband
+
+    options.clear()
+
+    expr = bm.Experiment(linsolver='dense')
+    expr.add_step('current_C', 1., (600., 60.))
+
+    soln = sim.run(expr)
+    assert soln.success
+
+    assert options['linsolver'] == 'dense'
+    assert 'lband' not in options and 'uband' not in options
@@ -1,6 +1,6 @@
 import pytest
 
-from bmlite._utils import ProgressBar
+from bmlite._utils import ProgressBar, _load_yaml
 
 
 def test_progbar_initialization():
@@ -41,3 +41,21 @@ def test_manual_progbar():
 
     bar.reset()
     assert bar._iter == 0
+
+
+def test_load_yaml(tmp_path):
+    import os
+
+    file = tmp_path / 'test.yaml'
+    file.write_text('battery:\n  cap: 1.0\n')
+
+    first = _load_yaml(file)
+    second = _load_yaml(file)
+
+    assert first == second == {'battery': {'cap': 1.0}}
+    assert first is not second
+
+    file.write_text('battery:\n  cap: 2.0\n')
+    os.utime(file, ns=(0, file.stat().st_mtime_ns + 10**9))
+
+    assert _load_yaml(file)['battery']['cap'] == 2.0